@@ -0,0 +1,64 @@
+"""Numba-compiled version of the per-turn entropy loop.
+
+Words are uint8 matrices from wordle_agent.encode_words and feedback patterns
+use the same base-3 encoding as wordle_agent.encode_feedback. Importing this
+module raises ImportError when numba isn't installed.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def feedback_code(guess, answer):
+    """Base-3 encoded feedback of guess against answer (both uint8 rows)."""
+    word_length = guess.shape[0]
+    remaining = np.zeros(26, np.int32)
+    for i in range(word_length):
+        if guess[i] != answer[i]:
+            remaining[answer[i] - 97] += 1
+
+    code = 0
+    power = 1
+    for i in range(word_length):
+        if guess[i] == answer[i]:
+            code += 2 * power
+        elif remaining[guess[i] - 97] > 0:
+            remaining[guess[i] - 97] -= 1
+            code += power
+        power *= 3
+    return code
+
+
+@njit(cache=True, parallel=True)
+def compute_all_entropies(words_u8):
+    """
+    Entropy and largest feedback group of each word over all the words.
+
+    Matches wordle_agent.pattern_partition_stats: entry s describes the
+    distribution of feedback(candidate, s) over all candidates.
+    """
+    n = words_u8.shape[0]
+    entropies = np.empty(n)
+    max_group_sizes = np.empty(n, np.int64)
+
+    for solution in prange(n):
+        codes = np.empty(n, np.int64)
+        for j in range(n):
+            codes[j] = feedback_code(words_u8[j], words_u8[solution])
+
+        # Group equal codes by sorting, so the work doesn't depend on 3**word_length
+        codes.sort()
+        weighted = 0.0
+        largest = 0
+        run = 1
+        for j in range(1, n + 1):
+            if j < n and codes[j] == codes[j - 1]:
+                run += 1
+                continue
+            if run > 1:
+                weighted += run * np.log2(run)
+            largest = max(largest, run)
+            run = 1
+        entropies[solution] = np.log2(n) - weighted / n
+        max_group_sizes[solution] = largest
+    return entropies, max_group_sizes
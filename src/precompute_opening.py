@@ -0,0 +1,41 @@
+import json
+import logging
+from typing import Dict
+
+from wordle_agent import OPENING_BOOK_FILE, Solver, decode_feedback, get_feedback, guess
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def build_opening_book(solver: Solver) -> Dict:
+    """
+    Precompute the agent's first guess and its reply to every first-turn feedback.
+
+    Args:
+        solver: Solver for the official Wordle word list, sorted by decreasing information gain
+
+    Returns:
+        Dict with the first guess and a map from feedback string (e.g. "20100")
+        to the second guess the agent would play
+    """
+    first_guess = solver.word_list[0]
+    second_guesses: Dict[str, str] = {}
+    for answer in solver.word_list:
+        feedback = decode_feedback(get_feedback(first_guess, answer), solver.word_length)
+        key = ''.join(map(str, feedback))
+        if answer == first_guess or key in second_guesses:
+            continue
+        second_guesses[key] = guess([first_guess], set(), feedback, solver.new_csp(),
+                                    feedback_table=solver.feedback_table)
+
+    return {'first_guess': first_guess, 'second_guesses': dict(sorted(second_guesses.items()))}
+
+def main() -> None:
+    """Build the opening book for the official word list and save it."""
+    opening_book = build_opening_book(Solver(5, official_list=True))
+    with OPENING_BOOK_FILE.open('w') as f:
+        json.dump(opening_book, f, indent=2)
+    logging.info(f"Saved {len(opening_book['second_guesses'])} second guesses to {OPENING_BOOK_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -1,74 +1,146 @@
+from array import array
+from typing import Iterable
+
+
+# Bitmask with all 26 letters set
+ALPHABET_MASK = (1 << 26) - 1
+
+def letter_mask(letters: Iterable[str]) -> int:
+    """Return a 26-bit mask with bit (ord(c) - ord('a')) set for each letter c."""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (ord(letter) - 97)
+    return mask
+
+def mask_letters(mask: int) -> list[str]:
+    """Return the letters whose bits are set in mask, in alphabetical order."""
+    letters = []
+    while mask:
+        low_bit = mask & -mask
+        letters.append(chr(low_bit.bit_length() + 96))
+        mask ^= low_bit
+    return letters
+
 class TrieNode:
     """A node in the Trie data structure.
-    
+
     Attributes:
-        children (dict): Maps characters to child TrieNodes
+        mask (int): letter_mask of the letters that have a child
+        children (list): Child TrieNode for each letter index 0-25, or None
         is_end (bool): True if this node represents the end of a word
     """
+    __slots__ = ('mask', 'children', 'is_end')
+
     def __init__(self):
-        self.children: dict[str, 'TrieNode'] = {}
+        self.mask: int = 0
+        self.children: list['TrieNode | None'] = [None] * 26
         self.is_end: bool = False
 
 class Trie:
+    """Trie built from TrieNodes and searched through a flattened, suffix-merged array copy.
+
+    Attributes:
+        root (TrieNode): Root of the node tree that insert() grows
+        root_id (int): Index of the root in the flattened arrays
+        edge_start (array): Edges of node n are edge_start[n]:edge_start[n + 1]
+        edge_letter (array): Letter index (0-25) labelling each edge
+        edge_target (array): Node each edge leads to
+        is_end (array): 1 if the node ends a word
+    """
     def __init__(self):
         self.root = TrieNode()
+        self._max_length = 0
+        self._finalized = False
 
     def insert(self, word: str) -> None:
         node = self.root
         for letter in word:
-            if letter not in node.children:
-                node.children[letter] = TrieNode()
-            node = node.children[letter]
+            index = ord(letter) - 97
+            if not node.mask >> index & 1:
+                node.mask |= 1 << index
+                node.children[index] = TrieNode()
+            node = node.children[index]
         node.is_end = True
+        self._max_length = max(self._max_length, len(word))
+        self._finalized = False
+
+    def finalize(self) -> None:
+        """Flatten the node tree into the arrays used by search_with_constraints.
 
-    def search_with_constraints(self, required_letters: set[str], domains: list[set[str]]) -> list[str]:
+        Identical subtrees (e.g. shared suffixes like "-ing") are stored once,
+        so the arrays describe a minimal DAWG rather than the full tree.
+        """
+        self.edge_start = array('I', [0])
+        self.edge_letter = array('B')
+        self.edge_target = array('I')
+        self.is_end = array('B')
+        node_ids: dict[tuple, int] = {}
+
+        def add_node(node: TrieNode) -> int:
+            # Children get their ids first, so a subtree is identified by its end flag and edges
+            edges = []
+            mask = node.mask
+            while mask:
+                low_bit = mask & -mask
+                index = low_bit.bit_length() - 1
+                edges.append((index, add_node(node.children[index])))
+                mask ^= low_bit
+
+            signature = (node.is_end, tuple(edges))
+            if signature not in node_ids:
+                node_ids[signature] = len(self.is_end)
+                self.is_end.append(node.is_end)
+                for index, target in edges:
+                    self.edge_letter.append(index)
+                    self.edge_target.append(target)
+                self.edge_start.append(len(self.edge_target))
+            return node_ids[signature]
+
+        self.root_id = add_node(self.root)
+        self._finalized = True
+        # Callers that play the whole list reuse this instead of searching it every turn
+        self._words = self.search_with_constraints(0, [ALPHABET_MASK] * self._max_length)
+
+    @property
+    def words(self) -> list[str]:
+        """Every inserted word in alphabetical order, listed once per finalize()."""
+        if not self._finalized:
+            self.finalize()
+        return self._words
+
+    def search_with_constraints(self, required_mask: int, domain_masks: list[int]) -> list[str]:
         """Search for words matching given constraints.
 
         Args:
-            required_letters: Letters that must appear in the word at least once
-            domains: domains[i] contains allowed letters at position i
+            required_mask: letter_mask of the letters that must appear in the word at least once
+            domain_masks: domain_masks[i] is the letter_mask of allowed letters at position i
 
         Returns:
-            List of valid words satisfying all constraints
+            List of valid words satisfying all constraints, in alphabetical order
         """
-        results: list[str] = []
-        self._dfs(
-            node=self.root,
-            prefix="",
-            found_letters=set(),
-            required_letters=required_letters,
-            domains=domains,
-            results=results
-        )
-        return results
+        if not self._finalized:
+            self.finalize()
+        edge_start, edge_letter, edge_target, is_end = (
+            self.edge_start, self.edge_letter, self.edge_target, self.is_end)
+        max_depth = len(domain_masks)
 
-    def _dfs(
-        self,
-        node: TrieNode,
-        prefix: str,
-        found_letters: set[str],
-        required_letters: set[str],
-        domains: list[set[str]],
-        results: list[str]
-    ) -> None:
-        if node.is_end and required_letters.issubset(found_letters):
-            results.append(prefix)
-            
-        index = len(prefix)
-        if index >= len(domains):
-            return
-        
-        for letter in domains[index]:
-            if letter not in node.children:
+        results: list[str] = []
+        # The path to the node being visited; its ancestors were the last nodes popped at each depth
+        path = bytearray(max_depth)
+        stack = [(self.root_id, 0, 0, 0)]  # (node, depth, mask of letters on the path, last letter)
+        while stack:
+            node, depth, found, letter = stack.pop()
+            if depth:
+                path[depth - 1] = letter + 97
+            if is_end[node] and found & required_mask == required_mask:
+                results.append(path[:depth].decode())
+            if depth >= max_depth:
                 continue
-                
-            new_found = found_letters | {letter} if letter in required_letters else found_letters
-            
-            self._dfs(
-                node=node.children[letter],
-                prefix=prefix + letter,
-                found_letters=new_found,
-                required_letters=required_letters,
-                domains=domains,
-                results=results
-            )
\ No newline at end of file
+
+            domain = domain_masks[depth]
+            # Push in reverse so children are visited in alphabetical order
+            for edge in range(edge_start[node + 1] - 1, edge_start[node] - 1, -1):
+                bit = 1 << edge_letter[edge]
+                if bit & domain:
+                    stack.append((edge_target[edge], depth + 1, found | bit, edge_letter[edge]))
+        return results
@@ -1,8 +1,11 @@
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
-import re
-from typing import Dict, List, Set
+from typing import BinaryIO, Callable, Dict, List, Set
+
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -10,6 +13,13 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Use Path objects for file handling
 DICT_FILE = Path("expanded_word_list.txt")
 CACHE_FILE = Path("word_cache.json")
+# Binary copy of CACHE_FILE: one (count, n) uint8 matrix per word length n
+WORD_ARRAY_DIR = Path("word_cache")
+# Word lengths saved in WORD_ARRAY_DIR, written last so it also marks the arrays as complete
+WORD_LENGTHS_FILE = WORD_ARRAY_DIR / "lengths.json"
+
+# Word arrays already loaded by this process, keyed by word length
+_word_arrays: Dict[int, np.ndarray] = {}
 
 def is_valid_word(word: str) -> bool:
     """
@@ -21,7 +31,8 @@ def is_valid_word(word: str) -> bool:
     Returns:
         bool: True if the word is valid, False otherwise
     """
-    return re.fullmatch(r"[a-z]+", word) is not None
+    # isalpha() alone accepts non-ASCII letters and islower() alone accepts digits
+    return word.isascii() and word.isalpha() and word.islower()
 
 def build_word_cache() -> None:
     """
@@ -44,14 +55,88 @@ def build_word_cache() -> None:
         # Convert sets to lists before saving
         serializable_cache = {str(k): sorted(list(v)) for k, v in word_cache.items()}
         
-        with CACHE_FILE.open("w", encoding="utf-8") as f:
-            json.dump(serializable_cache, f, indent=2)
+        text = json.dumps(serializable_cache, indent=2)
+        _write_atomically(CACHE_FILE, lambda f: f.write(text.encode("utf-8")))
         logging.info(f"Word cache saved to {CACHE_FILE}")
+        save_word_arrays(serializable_cache)
         
     except IOError as e:
         logging.error(f"Error accessing files: {e}")
         raise
 
+def _write_atomically(path: Path, write: Callable[[BinaryIO], object]) -> None:
+    """
+    Write a file through a temporary file in the same directory, then move it into place.
+    
+    Other processes reading path see either the old or the new file, never a partial one.
+    
+    Args:
+        path: The file to write
+        write: Function writing the file contents to the open binary file it is given
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _word_array_path(n: int) -> Path:
+    return WORD_ARRAY_DIR / f"words_u8_{n}.npy"
+
+def save_word_arrays(word_cache: Dict[str, List[str]]) -> None:
+    """
+    Save each word list of the cache as a uint8 matrix, keeping the list order.
+    
+    Args:
+        word_cache: Dictionary mapping word lengths to lists of words
+    """
+    WORD_ARRAY_DIR.mkdir(exist_ok=True)
+    for key, words in word_cache.items():
+        n = int(key)
+        words_u8 = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(-1, n)
+        _write_atomically(_word_array_path(n), lambda f: np.save(f, words_u8))
+    lengths = sorted(int(key) for key in word_cache)
+    _write_atomically(WORD_LENGTHS_FILE, lambda f: f.write(json.dumps(lengths).encode("utf-8")))
+    _word_arrays.clear()
+    logging.info(f"Word arrays saved to {WORD_ARRAY_DIR}")
+
+def get_word_array(n: int) -> np.ndarray:
+    """
+    Retrieve words of specified length from the binary cache.
+    
+    The array is memory-mapped on first use and shared by later calls.
+    
+    Args:
+        n: The length of words to retrieve
+        
+    Returns:
+        np.ndarray: Read-only uint8 array of shape (word count, n) holding ASCII codes
+    """
+    if n in _word_arrays:
+        return _word_arrays[n]
+
+    # Rebuild cache if it doesn't exist or is older than the dictionary
+    if not CACHE_FILE.exists() or CACHE_FILE.stat().st_mtime < DICT_FILE.stat().st_mtime:
+        build_word_cache()
+
+    # Lengths without words have no array file, so check the arrays as a whole
+    if (not WORD_LENGTHS_FILE.exists()
+            or WORD_LENGTHS_FILE.stat().st_mtime < CACHE_FILE.stat().st_mtime):
+        with CACHE_FILE.open("r", encoding="utf-8") as f:
+            word_cache = json.load(f)
+        save_word_arrays(word_cache)
+
+    with WORD_LENGTHS_FILE.open("r", encoding="utf-8") as f:
+        lengths = json.load(f)
+    if n in lengths:
+        _word_arrays[n] = np.load(_word_array_path(n), mmap_mode="r")
+    else:
+        _word_arrays[n] = np.empty((0, n), dtype=np.uint8)
+    return _word_arrays[n]
+
 def get_words(n: int) -> List[str]:
     """
     Retrieve words of specified length from the cache.
@@ -63,14 +148,8 @@ def get_words(n: int) -> List[str]:
         List[str]: List of words with the specified length
     """
     try:
-        # Rebuild cache if it doesn't exist or is older than the dictionary
-        if not CACHE_FILE.exists() or CACHE_FILE.stat().st_mtime < DICT_FILE.stat().st_mtime:
-            build_word_cache()
-        
-        with CACHE_FILE.open("r", encoding="utf-8") as f:
-            word_cache = json.load(f)
-        
-        return word_cache.get(str(n), [])
+        text = get_word_array(n).tobytes().decode("ascii")
+        return [text[i:i + n] for i in range(0, len(text), n)]
     
     except IOError as e:
         logging.error(f"Error accessing cache file: {e}")
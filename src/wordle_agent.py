@@ -1,13 +1,34 @@
 from playwright.sync_api import sync_playwright
-from word_cache_creation import get_words
-from trie_search import Trie
-import math
+from word_cache_creation import get_words, is_valid_word
+from trie_search import letter_mask, mask_letters
+from functools import lru_cache
+from pathlib import Path
+import json
+import weakref
+import numpy as np
+
+try:
+    import fast_wordle
+except ImportError:
+    # numba isn't installed; the NumPy routines below are used instead
+    fast_wordle = None
+
+# Upper bound on the number of elements in intermediate arrays of the batched entropy routines
+MAX_BLOCK_ELEMENTS = 1 << 22
+# Largest word list whose full feedback matrix is precomputed (2-4 bytes per word pair)
+MAX_CACHED_WORDS = 5000
+# Precomputed official-list opening, generated by precompute_opening.py
+OPENING_BOOK_FILE = Path('opening_book.json')
 
 class CSP:
     def __init__(self, variables, domains, constraints):
         self.variables = variables
-        self.domains = {var: set(domains) for var in variables}
+        # domains[var] is a letter_mask of the letters allowed at position var
+        self.domains = [letter_mask(domains) for var in variables]
         self.constraints = constraints
+        # Mask over the FeedbackTable's words of those consistent with all feedback so far,
+        # set up by guess() on the first turn
+        self.candidates = None
 
 def get_word_list(word_length, wordle_official=False):
     """
@@ -30,15 +51,26 @@ def get_word_list(word_length, wordle_official=False):
     # Otherwise use expanded dictionary filtered by word length
     return get_words(word_length)
 
-def build_conflict_tuples(guesses, domains_list):
+@lru_cache(maxsize=None)
+def load_opening_book():
     """
-    Identify multi-letter positions in domains_list, then
-    for each guess word, build tuples containing letters at those positions.
-    The length of each tuple equals the number of multi-letter domains.
+    Load the precomputed opening book for the official word list.
+
+    Returns:
+        dict | None: {'first_guess': str, 'second_guesses': {feedback string: str}},
+                     or None if the book hasn't been generated
     """
-    # Which positions in the domain have length>1?
-    multi_positions = [i for i, dom in enumerate(domains_list) if len(dom) > 1]
+    if not OPENING_BOOK_FILE.exists():
+        return None
+    with OPENING_BOOK_FILE.open('r') as f:
+        return json.load(f)
 
+def build_conflict_tuples(guesses, multi_positions):
+    """
+    For each guess word, build tuples containing letters at the
+    multi-letter domain positions given by multi_positions.
+    The length of each tuple equals the number of multi-letter domains.
+    """
     conflict_tuples = set()
     for w in guesses:
         # For this word, take letters at all multi-letter positions
@@ -48,75 +80,268 @@ def build_conflict_tuples(guesses, domains_list):
     return conflict_tuples
 
 def get_feedback(guess, answer):
-    feedback = [0] * len(guess)
-    answer_chars = list(answer)
+    """
+    Score guess against answer, returning the feedback encoded as by encode_feedback.
+
+    Use decode_feedback to recover the per-position values
+    (2 = green, 1 = yellow, 0 = grey).
+    """
+    remaining = [0] * 26  # Unmatched answer letters, indexed by ord(letter) - ord('a')
+    green = 0  # Bit i set if position i is green
 
     # First pass: Check for correct letters in the correct position.
-    for i in range(len(guess)):
-        if guess[i] == answer[i]:
-            feedback[i] = 2
-            answer_chars[i] = None  # Remove matched letter.
+    for i, letter in enumerate(answer):
+        if guess[i] == letter:
+            green |= 1 << i
+        else:
+            remaining[ord(letter) - 97] += 1
 
     # Second pass: Check for correct letters in the wrong position.
-    for i in range(len(guess)):
-        if feedback[i] == 0 and guess[i] in answer_chars:
-            feedback[i] = 1
-            answer_chars[answer_chars.index(guess[i])] = None
-
-    return tuple(feedback)
-
-def get_all_feedback_patterns(word_length=5):
-    # Generate all possible feedback patterns (3^n combinations of 0,1,2)
-    def generate_patterns_recursive(length, current=[]):
-        if length == 0:
-            patterns.append(tuple(current))
-            return
-        for i in range(3):
-            generate_patterns_recursive(length - 1, current + [i])
-    
-    patterns = []
-    generate_patterns_recursive(word_length)
-    return patterns
+    pattern = 0
+    power = 1
+    for i, letter in enumerate(guess):
+        if green >> i & 1:
+            pattern += 2 * power
+        elif remaining[ord(letter) - 97]:
+            pattern += power
+            remaining[ord(letter) - 97] -= 1
+        power *= 3
+
+    return pattern
+
+def decode_feedback(pattern, word_length):
+    """
+    Inverse of encode_feedback for a single pattern.
 
-def compute_new_entropy(solution, candidates):
+    Args:
+        pattern (int): Base-3 encoded feedback
+        word_length (int): Number of positions in the feedback
+
+    Returns:
+        list[int]: Feedback value (0, 1, 2) for each position
     """
-    Compute entropy for a potential answer given the candidate list.
-    
+    feedback = []
+    for _ in range(word_length):
+        pattern, value = divmod(pattern, 3)
+        feedback.append(value)
+    return feedback
+
+def _pattern_dtype(word_length):
+    """Smallest unsigned integer dtype holding every pattern in [0, 3**word_length)."""
+    for dtype in (np.uint16, np.uint32, np.uint64):
+        if 3 ** word_length - 1 <= np.iinfo(dtype).max:
+            return dtype
+    raise ValueError(f"Feedback patterns of {word_length}-letter words don't fit in 64 bits")
+
+def encode_feedback(feedback):
+    """
+    Encode feedback as a base-3 integer, sum(feedback[i] * 3**i).
+
     Args:
-        solution (str): The potential guess to evaluate
-        candidates (list[str]): List of possible answers
-    
+        feedback (array-like): Feedback values (0, 1, 2) along the last axis
+
     Returns:
-        float: Entropy for this guess
+        int or np.ndarray: Encoded pattern(s) in [0, 3**word_length)
+
+    Raises:
+        ValueError: If the patterns of this word length don't fit in 64 bits
     """
-    n = len(candidates)
-    word_length = len(candidates[0])
-    if n == 0:
-        return 0
-        
-    feedback_patterns = {pattern: 0 for pattern in get_all_feedback_patterns(word_length)}
-    for s in candidates:
-        pattern = get_feedback(s, solution)
-        feedback_patterns[pattern] += 1
-    feedback_distribution = {k: v/n for k, v in feedback_patterns.items()}
-    return -sum(prob * math.log2(prob) 
-               for prob in feedback_distribution.values() 
-               if prob > 0)
+    feedback = np.asarray(feedback, dtype=np.uint8)
+    word_length = feedback.shape[-1]
+    dtype = _pattern_dtype(word_length)
+    powers = np.array([3 ** i for i in range(word_length)], dtype=dtype)
+    return (feedback * powers).sum(axis=-1, dtype=dtype)
+
+def encode_words(words):
+    """
+    Pack equal-length lowercase words into a uint8 matrix.
+
+    Args:
+        words (list[str]): Words of identical length
+
+    Returns:
+        np.ndarray: Array of shape (len(words), word_length) holding ASCII codes
+    """
+    if not words:
+        return np.empty((0, 0), dtype=np.uint8)
+    return np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(len(words), -1)
+
+def feedback_matrix(guesses_u8, answers_u8):
+    """
+    Compute the feedback of every guess against every answer at once.
+
+    Each pattern is base-3 encoded with encode_feedback, using the same
+    0/1/2 (grey/yellow/green) values as get_feedback.
+
+    Args:
+        guesses_u8 (np.ndarray): uint8 array of shape (G, L) from encode_words
+        answers_u8 (np.ndarray): uint8 array of shape (A, L) from encode_words
+
+    Returns:
+        np.ndarray: Array of shape (G, A) where [g, a] equals get_feedback(guess g, answer a)
+    """
+    word_length = guesses_u8.shape[1]
+    guesses = guesses_u8[:, None, :]
+    answers = answers_u8[None, :, :]
+    green = guesses == answers
+    feedback = green.astype(np.uint8) * 2
+
+    # A non-green letter is yellow while the answer still has unmatched copies of it,
+    # i.e. when earlier non-green occurrences in the guess haven't used them all up.
+    for i in range(word_length):
+        letter = guesses[:, :, i:i + 1]
+        available = ((answers == letter) & ~green).sum(axis=2)
+        claimed = ((guesses[:, :, :i] == letter) & ~green[:, :, :i]).sum(axis=2)
+        feedback[:, :, i] |= ~green[:, :, i] & (available > claimed)
+
+    return encode_feedback(feedback)
+
+def pattern_partition_stats(patterns):
+    """
+    Summarize how each row of patterns partitions the candidates into feedback groups.
+
+    Groups are found by sorting each row and measuring runs of equal patterns,
+    so the cost depends on the number of candidates rather than on 3**word_length.
+
+    Args:
+        patterns (np.ndarray): (R, n) array of base-3 encoded feedback patterns
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: For each of the R rows, the entropy of the
+            feedback distribution and the size of its largest group
+    """
+    rows, n = patterns.shape
+    patterns = np.sort(patterns, axis=1)
+    group_starts = np.ones((rows, n), dtype=bool)
+    group_starts[:, 1:] = patterns[:, 1:] != patterns[:, :-1]
+
+    # Every row starts a new group at column 0, so runs never span two rows
+    boundaries = np.flatnonzero(group_starts)
+    sizes = np.diff(boundaries, append=rows * n)
+    group_rows = boundaries // n
+    first_groups = np.flatnonzero(boundaries % n == 0)
+
+    # H = -sum(c/n * log2(c/n)) = log2(n) - sum(c * log2(c)) / n
+    weighted = np.bincount(group_rows, weights=sizes * np.log2(sizes), minlength=rows)
+    return np.log2(n) - weighted / n, np.maximum.reduceat(sizes, first_groups)
+
+def _select_max_entropy(guesses, guess_entropies, max_group_sizes):
+    """Pick the highest-entropy guess, breaking ties by smallest largest group, then list order."""
+    # Round away summation noise so equal partitions compare as ties
+    order = np.lexsort((np.arange(len(guesses)), max_group_sizes, -np.round(guess_entropies, 9)))
+    return guesses[int(order[0])]
+
+class FeedbackTable:
+    """
+    Encoded word list used to score and filter candidates, computed once.
+
+    Attributes:
+        words (list[str]): The word list
+        words_u8 (np.ndarray): encode_words(words)
+        index (dict[str, int]): Position of each word in words
+        sorted_words (list[str]): The words in alphabetical order
+        patterns (np.ndarray | None): patterns[g, a] equals get_feedback(words[g], words[a]),
+            or None if the list is empty or longer than MAX_CACHED_WORDS
+    """
+    def __init__(self, words):
+        self.words = words
+        self.words_u8 = encode_words(words)
+        self.index = {word: i for i, word in enumerate(words)}
+        self.sorted_words = sorted(words)
+        self.patterns = None
+        n, word_length = self.words_u8.shape
+        if 0 < n <= MAX_CACHED_WORDS:
+            block = max(1, MAX_BLOCK_ELEMENTS // (n * word_length))
+            self.patterns = np.vstack([feedback_matrix(self.words_u8[start:start + block], self.words_u8)
+                                       for start in range(0, n, block)])
+
+    def feedback_row(self, guess):
+        """Encoded feedback of guess against every word in the list."""
+        if self.patterns is not None and guess in self.index:
+            return self.patterns[self.index[guess]]
+        return feedback_matrix(encode_words([guess]), self.words_u8)[0]
+
+    def position_masks(self, candidates):
+        """letter_mask of the letters found at each position among the candidate words."""
+        bits = np.left_shift(np.uint32(1), self.words_u8[candidates] - np.uint8(97))
+        return [int(mask) for mask in np.bitwise_or.reduce(bits, axis=0)]
+
+_feedback_tables: dict[tuple[str, ...], FeedbackTable] = {}
+
+def get_feedback_table(word_list):
+    """
+    Get the cached FeedbackTable for a word list, building it on first use.
+
+    Tables are keyed by the words themselves, in order, so different lists
+    of the same length never share a table.
+
+    Args:
+        word_list (list[str]): Words the table should cover
+
+    Returns:
+        FeedbackTable: The table for word_list
+    """
+    key = tuple(word_list)
+    if key not in _feedback_tables:
+        _feedback_tables[key] = FeedbackTable(list(key))
+    return _feedback_tables[key]
+
+# Table of each trie passed to guess(), with the Trie.words list and word length it was built for
+_trie_feedback_tables: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-def get_max_entropy_guess(guesses):
+def _get_trie_feedback_table(trie, word_length):
+    """
+    Get the FeedbackTable for the word_length-letter words of a trie, built once per trie.
+
+    Args:
+        trie (Trie): Trie holding the word list
+        word_length (int): Length of the words to play with
+
+    Returns:
+        FeedbackTable: The table for the trie's words, rebuilt only after new inserts
+    """
+    words = trie.words
+    cached = _trie_feedback_tables.get(trie)
+    if cached is None or cached[0] is not words or cached[1] != word_length:
+        table = get_feedback_table([word for word in words if len(word) == word_length])
+        _trie_feedback_tables[trie] = cached = (words, word_length, table)
+    return cached[2]
+
+def get_max_entropy_guess(guesses, feedback_table=None):
     """
     Find the guess that provides maximum information gain by maximizing entropy.
     
     Args:
         guesses (list[str]): List of possible guesses
+        feedback_table (FeedbackTable, optional): Table covering guesses
     
     Returns:
         str: The most informative guess
     """
-    guess_entropies = [compute_new_entropy(guess, guesses) 
-                      for guess in guesses]
-    selected_guess_idx = guess_entropies.index(max(guess_entropies))
-    return guesses[selected_guess_idx]
+    words_u8 = encode_words(guesses)
+    n, word_length = words_u8.shape
+    if feedback_table is not None and feedback_table.patterns is None:
+        feedback_table = None
+    if feedback_table is None and fast_wordle is not None:
+        guess_entropies, max_group_sizes = fast_wordle.compute_all_entropies(words_u8)
+        return _select_max_entropy(guesses, guess_entropies, max_group_sizes)
+
+    if feedback_table is not None:
+        indices = np.array([feedback_table.index[word] for word in guesses])
+    # Score guesses in blocks so the (n, block, L) comparison arrays stay bounded
+    block = max(1, MAX_BLOCK_ELEMENTS // (n * word_length))
+
+    guess_entropies = np.empty(n)
+    max_group_sizes = np.empty(n, dtype=np.int64)
+    for start in range(0, n, block):
+        # Entry s of a row scores get_feedback(candidate, solution s) over all candidates
+        if feedback_table is not None:
+            patterns = feedback_table.patterns[np.ix_(indices, indices[start:start + block])].T
+        else:
+            patterns = feedback_matrix(words_u8, words_u8[start:start + block]).T
+        (guess_entropies[start:start + block],
+         max_group_sizes[start:start + block]) = pattern_partition_stats(patterns)
+    return _select_max_entropy(guesses, guess_entropies, max_group_sizes)
 
 def _process_green_letters(previous_word, feedback, yellow_letters, csp):
     """Process green (correct position) letters from feedback."""
@@ -124,38 +349,33 @@ def _process_green_letters(previous_word, feedback, yellow_letters, csp):
         if result == 2:
             if letter in yellow_letters:
                 yellow_letters.discard(letter)
-            csp.domains[i] = {letter}
+            csp.domains[i] = letter_mask(letter)
 
-def _process_yellow_grey_letters(previous_word, feedback, yellow_letters, csp):
-    """Process yellow and grey letters from feedback."""
-    grey_letters = set()
+def _process_yellow_letters(previous_word, feedback, yellow_letters, csp):
+    """Process yellow letters from feedback; grey letters only matter through candidate filtering."""
     for i, (letter, result) in enumerate(zip(previous_word, feedback)):
-        if result == 0:
-            grey_letters.add(letter)
-        elif result == 1:
-            csp.domains[i].discard(letter)
+        if result == 1:
+            csp.domains[i] &= ~letter_mask(letter)
             yellow_letters.add(letter)
-    return grey_letters
-
-def _calculate_word_score(word, unsolved_letters_list, domains_list, conflict_tuples, unsolved_letters_priority):
-    """Calculate score for a candidate word."""
-    remaining_letters = unsolved_letters_list.copy()
-    for letter in set(word):
-        if letter in remaining_letters:
-            remaining_letters.remove(letter)
-    
-    score = len(unsolved_letters_list) - len(remaining_letters)
+
+def _calculate_word_score(word, unsolved_mask, multi_positions, conflict_masks, unsolved_letters_priority):
+    """Calculate score for a candidate word.
+
+    unsolved_mask, multi_positions and conflict_masks depend only on the turn,
+    so guess() computes them once for all candidates.
+    """
+    # Number of distinct unsolved letters the word covers
+    score = (letter_mask(word) & unsolved_mask).bit_count()
     
     # Check conflict tuples
-    multi_positions = [i for i, dom in enumerate(domains_list) if len(dom) > 1]
-    word_tuple = tuple(word[i] for i in multi_positions)
-    if any(len(set(word_tuple) & set(ct)) > 1 for ct in conflict_tuples):
+    word_tuple_mask = letter_mask(word[i] for i in multi_positions)
+    if any((word_tuple_mask & conflict_mask).bit_count() > 1 for conflict_mask in conflict_masks):
         score = 0
     
-    starts_with_priority = bool(word and word[0] in unsolved_letters_priority)
+    starts_with_priority = bool(word and letter_mask(word[0]) & unsolved_letters_priority)
     return score, starts_with_priority
 
-def guess(guessed_words, yellow_letters, feedback, csp, trie):
+def guess(guessed_words, yellow_letters, feedback, csp, trie=None, feedback_table=None, opening_book=None):
     """
     Generate the next optimal guess for Wordle based on previous guesses and feedback.
     
@@ -174,19 +394,25 @@ def guess(guessed_words, yellow_letters, feedback, csp, trie):
             - 0 = letter not in word (grey)
         csp (CSP): Constraint satisfaction problem instance containing:
             - variables: positions in the word (0 to word_length-1)
-            - domains: possible letters for each position
-        trie (Trie): Trie data structure containing valid word list for efficient search
+            - domains: letter_mask of the possible letters for each position
+            - candidates: mask over feedback_table.words of the words still consistent
+              with all feedback, so every call of a game must use the same table
+        trie (Trie, optional): Word list to play with, used only when feedback_table is None
+        feedback_table (FeedbackTable, optional): Encoded word list the candidates and the
+            late-game scoring pool are drawn from; built from the trie's words if omitted
+        opening_book (dict, optional): Precomputed second guesses from load_opening_book
         
     Returns:
         str: The next word to guess
         
     Raises:
         ValueError: If there's a length mismatch between previous word, feedback,
-                  and CSP variables
+                  and CSP variables, or if neither trie nor feedback_table is given
     
     Strategy:
-    1. Updates CSP domains based on feedback from previous guess
-    2. If remaining valid words <= remaining attempts, returns first valid word
+    1. Narrows the candidate words and CSP domains using feedback from previous guess
+    2. If remaining valid words <= remaining attempts (or at most two remain),
+       returns first valid word
     3. For late game (>50% letters known):
        - Scores candidate words based on unsolved letter coverage
        - Penalizes words with letter patterns matching previous incorrect guesses
@@ -200,59 +426,74 @@ def guess(guessed_words, yellow_letters, feedback, csp, trie):
     if len(previous_word) != len(feedback) or len(previous_word) != len(csp.variables):
         raise ValueError("Length mismatch between previous word, feedback and variables")
 
+    if feedback_table is None:
+        if trie is None:
+            raise ValueError("guess() needs a trie or a feedback_table")
+        feedback_table = _get_trie_feedback_table(trie, word_length)
+
     # Process feedback
     _process_green_letters(previous_word, feedback, yellow_letters, csp)
-    grey_letters = _process_yellow_grey_letters(previous_word, feedback, yellow_letters, csp)
-    
-    # Apply constraints and get valid guesses
-    for i in csp.variables:
-        if len(csp.domains[i]) > 1:
-            csp.domains[i] -= (grey_letters - yellow_letters)
-    
-    guesses = [word for word in trie.search_with_constraints(yellow_letters, list(csp.domains.values()))
-               if word not in guessed_words]
+    _process_yellow_letters(previous_word, feedback, yellow_letters, csp)
+
+    # Keep the words that would have produced the same feedback for the previous guess
+    if csp.candidates is None:
+        csp.candidates = np.ones(len(feedback_table.words), dtype=bool)
+    csp.candidates &= feedback_table.feedback_row(guessed_words[-1]) == encode_feedback(feedback)
+    guessed_set = set(guessed_words)
+    guesses = [feedback_table.words[i] for i in np.flatnonzero(csp.candidates)
+               if feedback_table.words[i] not in guessed_set]
     
     # Update domains based on valid guesses
+    position_masks = feedback_table.position_masks(csp.candidates)
     for i in csp.variables:
-        if len(csp.domains[i]) > 1:
-            csp.domains[i] = {word[i] for word in guesses}
+        if csp.domains[i].bit_count() > 1:
+            csp.domains[i] = position_masks[i]
+
+    # Second guess after the book's opener was precomputed to reduce latency
+    if opening_book is not None and guessed_words == [opening_book['first_guess']]:
+        second_guess = opening_book['second_guesses'].get(''.join(map(str, feedback)))
+        if second_guess is not None:
+            return second_guess
 
     # Early return if few possibilities remain
     attempt_num = len(guessed_words) + 1
     remaining_attempts = 6 - attempt_num + 1
-    if len(guesses) <= remaining_attempts:
+    if len(guesses) <= max(2, remaining_attempts):
         return guesses[0]
 
-    # Analyze current state
-    domains_list = list(csp.domains.values())
-    correctly_guessed = sum(1 for domain in domains_list if len(domain) == 1)
+    # Analyze current state once; everything below only reads this snapshot
+    domains_list = tuple(csp.domains)
+    # Which positions in the domain have more than one letter?
+    multi_positions = tuple(i for i, domain in enumerate(domains_list) if domain.bit_count() > 1)
+    correctly_guessed = word_length - len(multi_positions)
     
     # Build letter lists
     unsolved_letters = []
     solved_letters = []
-    for domain in domains_list:
-        if len(domain) == 1:
-            solved_letters.extend(list(domain))
+    for i, domain in enumerate(domains_list):
+        if i in multi_positions:
+            unsolved_letters.extend(mask_letters(domain))
         else:
-            unsolved_letters.extend(list(domain))
+            solved_letters.extend(mask_letters(domain))
     
     for letter in solved_letters:
         if letter in unsolved_letters:
             unsolved_letters.remove(letter)
     
-    unsolved_letters_priority = next((domain for domain in domains_list if len(domain) > 1), set())
+    unsolved_letters_priority = domains_list[multi_positions[0]] if multi_positions else 0
 
     # Choose strategy based on game state
     if correctly_guessed > (word_length-1)/2 and len(guesses) > 1 and attempt_num < 6:
         # Late game strategy
-        loosest_domain = [set('abcdefghijklmnopqrstuvwxyz') for _ in range(word_length)]
-        candidate_words = trie.search_with_constraints(set(), loosest_domain)
-        conflict_tuples = build_conflict_tuples(guesses, domains_list)
+        candidate_words = feedback_table.sorted_words
+        conflict_tuples = build_conflict_tuples(guesses, multi_positions)
+        unsolved_mask = letter_mask(unsolved_letters)
+        conflict_masks = [letter_mask(ct) for ct in conflict_tuples]
         
         # Score all possible words
         word_scores = [
-            (*_calculate_word_score(word, unsolved_letters, domains_list, 
-                                  conflict_tuples, unsolved_letters_priority), word)
+            (*_calculate_word_score(word, unsolved_mask, multi_positions,
+                                  conflict_masks, unsolved_letters_priority), word)
             for word in guesses + candidate_words
         ]
         
@@ -261,13 +502,92 @@ def guess(guessed_words, yellow_letters, feedback, csp, trie):
             return word_scores[0][2]
     
     # Early game strategy
-    return get_max_entropy_guess(guesses)
+    return get_max_entropy_guess(guesses, feedback_table)
     
 
 
+class Solver:
+    """
+    Wordle agent for one word list.
+
+    The word list, feedback table and opening book are built once in the
+    constructor and shared by every game; play() only creates per-game state.
+    """
+    def __init__(self, word_length: int, official_list: bool = False):
+        """
+        Args:
+            word_length (int): Length of the words to play with
+            official_list (bool): If True, use official Wordle word list, otherwise use expanded dictionary
+
+        Raises:
+            ValueError: If word_length is invalid or the word list has no words of that length
+        """
+        if not isinstance(word_length, int) or word_length < 1:
+            raise ValueError("word_length must be a positive integer")
+        self.word_length = word_length
+        self.word_list = get_word_list(word_length, official_list)
+        if not self.word_list:
+            raise ValueError(f"No words of length {word_length}")
+
+        self.feedback_table = get_feedback_table(self.word_list)
+        self.opening_book = load_opening_book() if official_list else None
+        self.first_guess = self.opening_book['first_guess'] if self.opening_book else self.word_list[0]
+
+    def new_csp(self) -> CSP:
+        """Create the CSP for a fresh game: every letter allowed at every position."""
+        return CSP(list(range(self.word_length)), set("abcdefghijklmnopqrstuvwxyz"), None)
+
+    def play(self, answer: str) -> tuple[int, int]:
+        """
+        Play a game of Wordle using the agent strategy.
+
+        Args:
+            answer (str): The word to be guessed
+
+        Returns:
+            tuple[int, int]: A tuple containing:
+                - Success flag (1 for win, 0 for loss)
+                - Number of attempts used
+
+        Raises:
+            ValueError: If answer length doesn't match the solver's word_length
+                or answer has characters other than lowercase a-z
+        """
+        if len(answer) != self.word_length:
+            raise ValueError(f"Answer length ({len(answer)}) doesn't match word_length ({self.word_length})")
+        # get_feedback indexes letter counts by ord(letter) - 97
+        if not is_valid_word(answer):
+            raise ValueError(f"Answer must contain only lowercase letters a-z, got {answer!r}")
+
+        # Game state variables
+        csp = self.new_csp()
+        max_attempts = 6
+        guessed_words = []
+        yellow_letters = set()
+        feedback = [0] * self.word_length
+
+        # Main game loop
+        for attempt_num in range(1, max_attempts + 1):
+            # Select guess based on game state
+            current_guess = self.first_guess if attempt_num == 1 else \
+                           guess(guessed_words, yellow_letters, feedback, csp,
+                                 feedback_table=self.feedback_table,
+                                 opening_book=self.opening_book)
+
+            guessed_words.append(current_guess)
+            feedback = decode_feedback(get_feedback(current_guess, answer), self.word_length)
+
+            # Early return on correct guess
+            if current_guess == answer:
+                return 1, attempt_num
+
+        return 0, max_attempts
+
 def agent_play_Wordle(word_length: int, answer: str, official_list: bool = False) -> tuple[int, int]:
     """
     Play a game of Wordle using the agent strategy.
+
+    Builds a new Solver for the game; use Solver directly to play many games.
     
     Args:
         word_length (int): Length of the target word
@@ -282,45 +602,11 @@ def agent_play_Wordle(word_length: int, answer: str, official_list: bool = False
     Raises:
         ValueError: If word_length doesn't match answer length or is invalid
     """
-    # Input validation
-    if not isinstance(word_length, int) or word_length < 1:
-        raise ValueError("word_length must be a positive integer")
+    # Reject a bad answer before loading the word list; Solver validates word_length
     if len(answer) != word_length:
         raise ValueError(f"Answer length ({len(answer)}) doesn't match word_length ({word_length})")
-    
-    # Initialize game state
-    domain = set("abcdefghijklmnopqrstuvwxyz")
-    variables = list(range(word_length))
-    word_list = get_word_list(word_length, official_list)
-    
-    # Set up trie for efficient word lookup
-    trie = Trie()
-    for word in word_list:
-        trie.insert(word)
 
-    # Initialize CSP solver
-    csp = CSP(variables, domain, None)
-    
-    # Game state variables
-    max_attempts = 6
-    guessed_words = []
-    yellow_letters = set()
-    feedback = [0] * word_length
-    
-    # Main game loop
-    for attempt_num in range(1, max_attempts + 1):
-        # Select guess based on game state
-        current_guess = word_list[0] if attempt_num == 1 else \
-                       guess(guessed_words, yellow_letters, feedback, csp, trie)
-        
-        guessed_words.append(current_guess)
-        feedback = get_feedback(current_guess, answer)
-        
-        # Early return on correct guess
-        if current_guess == answer:
-            return 1, attempt_num
-    
-    return 0, max_attempts
+    return Solver(word_length, official_list).play(answer)
 
 
     
@@ -329,16 +615,10 @@ def agent_play_Wordle_official():
     Simplified version of the user_play_Wordle() function suitable for the agent.
     Interacts dynamically with today's NY Times Wordle puzzle via Playwright's browser automation
     """
-    domain = set("abcdefghijklmnopqrstuvwxyz")  # 26-letter alphabet domain
-    variables = [i for i in range(5)]
-    word_list = get_word_list(5,True)
-    trie = Trie()
-    for word in word_list:
-        trie.insert(word)
-
+    solver = Solver(5, official_list=True)
 
     # Create CSP
-    csp = CSP(variables, domain, None)
+    csp = solver.new_csp()
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)  # Set to False to observe actions
         page = browser.new_page()
@@ -364,9 +644,11 @@ def agent_play_Wordle_official():
                 # word_list has been sorted by decreasing information gain
                 # the intial guess yielding the most information could have been computed here
                 # but it was pre-computed to reduce latency
-                current_guess = word_list[0]
+                current_guess = solver.first_guess
             else:
-                current_guess = guess(guessed_words,yellow_letters,feedback,csp,trie)
+                current_guess = guess(guessed_words,yellow_letters,feedback,csp,
+                                      feedback_table=solver.feedback_table,
+                                      opening_book=solver.opening_book)
             # Type the provided guess
             guessed_words.append(current_guess)
             page.keyboard.type(current_guess)
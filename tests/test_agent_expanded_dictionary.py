@@ -2,9 +2,11 @@ import json
 import time
 import random
 import logging
+from multiprocessing import Pool
 from typing import Dict, List, Optional
 from pathlib import Path
-from wordle_agent import agent_play_Wordle
+from word_cache_creation import get_word_array
+from wordle_agent import Solver
 
 # Configure logging
 logging.basicConfig(
@@ -15,23 +17,24 @@ logging.basicConfig(
 # Constants
 MAX_WORD_LENGTH = 9
 OUTPUT_FILE = 'wordle_validation.json'
+GAMES_PER_TASK = 32
 
 def play_single_game(
     answer: str,
-    word_length: int,
+    solver: Solver,
 ) -> Dict:
     """
     Play a single Wordle game.
     
     Args:
         answer: The target word to guess
-        word_length: Length of the word
+        solver: Solver built for the word's length
     
     Returns:
         Dict containing game results (win status, attempts, time, answer if lost)
     """
     start_time = time.time()
-    win, attempts = agent_play_Wordle(word_length, answer)
+    win, attempts = solver.play(answer)
     end_time = time.time()
     
     return {
@@ -41,6 +44,23 @@ def play_single_game(
         'answer': answer if not win else None
     }
 
+# Solver of the current pool worker, built once per word length by _init_worker
+_worker_solver: Optional[Solver] = None
+
+def _init_worker(word_length: int) -> None:
+    """Build the Solver shared by all games played in this worker process."""
+    global _worker_solver
+    _worker_solver = Solver(word_length)
+
+def _play_worker_game(answer: str) -> Optional[Dict]:
+    """Play one game with the worker's Solver, returning None if it fails."""
+    logging.debug(f"Playing game. Answer = {answer}")
+    try:
+        return play_single_game(answer, _worker_solver)
+    except Exception as e:
+        logging.error(f"Error playing game with word '{answer}': {str(e)}")
+        return None
+
 def process_game_results(results: List[Dict]) -> Dict:
     """
     Process a batch of game results and compute statistics.
@@ -88,17 +108,17 @@ def validate_wordle_agent(word_cache: Dict[str, List[str]]) -> Dict:
             word_cache[str(word_length)],
             min(1000, len(word_cache[str(word_length)]))
         )
-        results = []
-
-        # Process words sequentially
-        for i, answer in enumerate(word_list, 1):
-            logging.debug(f"Playing game {i}/{len(word_list)}. Answer = {answer}")
-            try:
-                result = play_single_game(answer, word_length)
-                results.append(result)
-            except Exception as e:
-                logging.error(f"Error playing game with word '{answer}': {str(e)}")
-                continue
+
+        # Build the binary word cache here so the workers only read it
+        get_word_array(word_length)
+
+        # Games are independent, so play them across all CPUs
+        with Pool(initializer=_init_worker, initargs=(word_length,)) as pool:
+            results = [
+                result for result in
+                pool.imap_unordered(_play_worker_game, word_list, chunksize=GAMES_PER_TASK)
+                if result is not None
+            ]
 
         # Process and store results
         stats[word_length] = process_game_results(results)
@@ -3,13 +3,15 @@ import time
 from pathlib import Path
 from typing import Dict, List, TypedDict
 import logging
+from multiprocessing import Pool
 from tqdm import tqdm
 
-from wordle_agent import agent_play_Wordle
+from wordle_agent import Solver
 
 # Constants
 OFFICIAL_WORDS_FILE = Path('wordle_words_official.txt')
 VALIDATION_RESULTS_FILE = Path('wordle_validation_official.json')
+GAMES_PER_TASK = 32
 
 # Configure logging
 logging.basicConfig(
@@ -29,19 +31,19 @@ class WordleStats(TypedDict):
     lost_games: List[str]
     win_rate: float
 
-def play_single_game(answer: str, word_length: int) -> GameResult:
+def play_single_game(answer: str, solver: Solver) -> GameResult:
     """Play a single Wordle game with the agent.
     
     Args:
         answer: The target word to guess
-        word_length: Length of the word
+        solver: Solver built for the official word list
         
     Returns:
         Dictionary containing game results including win status, attempts, time taken
     """
     try:
         start_time = time.time()
-        win, attempts = agent_play_Wordle(word_length, answer, official_list=True)
+        win, attempts = solver.play(answer)
         end_time = time.time()
         
         return {
@@ -54,6 +56,18 @@ def play_single_game(answer: str, word_length: int) -> GameResult:
         logging.error(f"Error playing game with answer '{answer}': {str(e)}")
         raise
 
+# Solver of the current pool worker, built once by _init_worker
+_worker_solver: Solver | None = None
+
+def _init_worker(word_length: int) -> None:
+    """Build the Solver shared by all games played in this worker process."""
+    global _worker_solver
+    _worker_solver = Solver(word_length, official_list=True)
+
+def _play_worker_game(answer: str) -> GameResult:
+    """Play one game with the worker's Solver."""
+    return play_single_game(answer, _worker_solver)
+
 def validate_wordle_agent() -> Dict[int, WordleStats]:
     """Validates the Wordle agent by playing games with all official words.
     
@@ -74,16 +88,20 @@ def validate_wordle_agent() -> Dict[int, WordleStats]:
             raise ValueError("Word list is empty")
             
         word_length = len(word_list[0])
-        results: List[GameResult] = []
-
-        # Process words with progress bar
-        for answer in tqdm(word_list, desc="Playing games"):
+        answers = []
+        for answer in word_list:
             if len(answer) != word_length:
                 logging.warning(f"Skipping word '{answer}' - incorrect length")
                 continue
-                
-            result = play_single_game(answer, word_length)
-            results.append(result)
+            answers.append(answer)
+
+        # Games are independent, so play them across all CPUs with progress bar
+        with Pool(initializer=_init_worker, initargs=(word_length,)) as pool:
+            results: List[GameResult] = list(tqdm(
+                pool.imap_unordered(_play_worker_game, answers, chunksize=GAMES_PER_TASK),
+                total=len(answers),
+                desc="Playing games"
+            ))
 
         # Calculate statistics
         game_times = [r['time'] for r in results]